@@ -14,7 +14,7 @@ from starlette.middleware.gzip import GZipMiddleware
 from starlette.routing import BaseRoute, Route
 from starlette_prometheus import PrometheusMiddleware
 
-from api.config import AppConfig, EndpointConfig, UvicornConfig
+from api.config import EndpointConfig, UvicornConfig, get_app_config
 from api.prometheus import Prometheus
 from api.routes.endpoint import EndpointsDefinition, create_endpoint
 from api.routes.healthcheck import healthcheck_endpoint
@@ -23,7 +23,7 @@ from api.routes.webhook import create_webhook_endpoint
 
 
 def create_app() -> Starlette:
-    app_config = AppConfig.from_env()
+    app_config = get_app_config()
 
     init_logging(log_level=app_config.common.log_level)
     # ^ set first to have logs as soon as possible
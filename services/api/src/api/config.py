@@ -2,7 +2,9 @@
 # Copyright 2022 The HuggingFace Authors.
 
 from dataclasses import dataclass, field
-from typing import List, Mapping, Optional
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 from environs import Env
 from libcommon.config import (
@@ -12,6 +14,13 @@ from libcommon.config import (
     QueueConfig,
 )
 
+
+@cache
+def _get_env() -> Env:
+    # the environment variables are read when accessed, so the same Env instance can be shared
+    return Env(expand_vars=True)
+
+
 API_UVICORN_HOSTNAME = "localhost"
 API_UVICORN_NUM_WORKERS = 2
 API_UVICORN_PORT = 8000
@@ -25,7 +34,7 @@ class UvicornConfig:
 
     @classmethod
     def from_env(cls) -> "UvicornConfig":
-        env = Env(expand_vars=True)
+        env = _get_env()
         with env.prefixed("API_UVICORN_"):
             return cls(
                 hostname=env.str(name="HOSTNAME", default=API_UVICORN_HOSTNAME),
@@ -49,7 +58,7 @@ class ApiConfig:
 
     @classmethod
     def from_env(cls, common_config: CommonConfig) -> "ApiConfig":
-        env = Env(expand_vars=True)
+        env = _get_env()
         with env.prefixed("API_"):
             hf_auth_path = env.str(name="HF_AUTH_PATH", default=API_HF_AUTH_PATH)
             external_auth_url = None if hf_auth_path is None else f"{common_config.hf_endpoint}{hf_auth_path}"
@@ -81,23 +90,33 @@ class AppConfig:
         )
 
 
-EndpointProcessingStepNamesMapping = Mapping[str, List[str]]
+@cache
+def get_app_config() -> AppConfig:
+    # the only cache of the config: the from_env methods always read the environment variables, so
+    # get_app_config.cache_clear() is enough to take changed environment variables into account
+    return AppConfig.from_env()
+
+
+EndpointProcessingStepNamesMapping = Mapping[str, Sequence[str]]
+
+# the mapping is constant: share a single read-only instance between all the EndpointConfig objects
+ENDPOINT_SPECIFICATION: EndpointProcessingStepNamesMapping = MappingProxyType(
+    {
+        "/config-names": ("/config-names",),
+        "/split-names-from-streaming": ("/split-names-from-streaming",),
+        "/splits": ("/splits",),
+        "/first-rows": ("/first-rows",),
+        "/parquet-and-dataset-info": ("/parquet-and-dataset-info",),
+        "/parquet": ("/parquet",),
+        "/dataset-info": ("/dataset-info",),
+        "/sizes": ("/sizes",),
+    }
+)
 
 
 @dataclass(frozen=True)
 class EndpointConfig:
-    specification: EndpointProcessingStepNamesMapping = field(
-        default_factory=lambda: {
-            "/config-names": ["/config-names"],
-            "/split-names-from-streaming": ["/split-names-from-streaming"],
-            "/splits": ["/splits"],
-            "/first-rows": ["/first-rows"],
-            "/parquet-and-dataset-info": ["/parquet-and-dataset-info"],
-            "/parquet": ["/parquet"],
-            "/dataset-info": ["/dataset-info"],
-            "/sizes": ["/sizes"],
-        }
-    )
+    specification: EndpointProcessingStepNamesMapping = field(default_factory=lambda: ENDPOINT_SPECIFICATION)
 
     @classmethod
     def from_env(cls) -> "EndpointConfig":
@@ -8,7 +8,9 @@ from libcommon.queue import _clean_queue_database
 from libcommon.resources import CacheMongoResource, QueueMongoResource
 from libcommon.simple_cache import _clean_cache_database
 from pytest import MonkeyPatch, fixture
+from starlette.testclient import TestClient
 
+from api.app import create_app
 from api.config import AppConfig, EndpointConfig, UvicornConfig
 from api.routes.endpoint import EndpointsDefinition
 
@@ -36,6 +38,13 @@ def app_config(monkeypatch_session: MonkeyPatch) -> AppConfig:
     return app_config
 
 
+@fixture(scope="session")
+def client(monkeypatch_session: MonkeyPatch) -> Iterator[TestClient]:
+    # the app is created once for the whole session, and the context manager runs its startup/shutdown events
+    with TestClient(create_app()) as client:
+        yield client
+
+
 @fixture(scope="session")
 def endpoint_definition(app_config: AppConfig) -> Mapping[str, List[ProcessingStep]]:
     processing_graph = ProcessingGraph(app_config.processing_graph.specification)
@@ -1,20 +1,17 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 The HuggingFace Authors.
 
+import re
 from typing import Mapping, Optional
 
 import pytest
 from pytest_httpserver import HTTPServer
 from starlette.testclient import TestClient
 
-from api.app import create_app
-
 from .utils import auth_callback
 
-
-@pytest.fixture(scope="module")
-def client(monkeypatch_session: pytest.MonkeyPatch) -> TestClient:
-    return TestClient(create_app())
+# a metric line (not a comment) of the Prometheus text format: "<name> <value>"
+METRIC_LINE_REGEX = re.compile(rb"^([^#\n][^ \n]*) ([^ \n]+)", re.MULTILINE)
 
 
 def test_cors(client: TestClient, first_dataset_endpoint: str) -> None:
@@ -132,9 +129,7 @@ def test_get_split_missing_parameter(
 def test_metrics(client: TestClient) -> None:
     response = client.get("/metrics")
     assert response.status_code == 200
-    text = response.text
-    lines = text.split("\n")
-    metrics = {line.split(" ")[0]: float(line.split(" ")[1]) for line in lines if line and line[0] != "#"}
+    metrics = {m.group(1).decode(): float(m.group(2)) for m in METRIC_LINE_REGEX.finditer(response.content)}
 
     # the middleware should have recorded the request
     name = 'starlette_requests_total{method="GET",path_template="/metrics"}'
@@ -7,7 +7,7 @@ from pytest import MonkeyPatch, fixture, mark
 from starlette.testclient import TestClient
 
 from api.app import create_app
-from api.config import AppConfig
+from api.config import AppConfig, get_app_config
 
 
 # see https://github.com/pytest-dev/pytest/issues/363#issuecomment-406536200
@@ -18,8 +18,11 @@ def real_monkeypatch() -> Iterator[MonkeyPatch]:
     monkeypatch.setenv("QUEUE_MONGO_DATABASE", "datasets_server_queue_test")
     monkeypatch.setenv("COMMON_HF_ENDPOINT", "https://huggingface.co")
     monkeypatch.setenv("COMMON_HF_TOKEN", "")
+    # the app config is cached, clear it to take the new environment variables into account
+    get_app_config.cache_clear()
     yield monkeypatch
     monkeypatch.undo()
+    get_app_config.cache_clear()
 
 
 @fixture(scope="module")
@@ -98,10 +98,7 @@ def compute_split_names_from_streaming_response(
     use_auth_token: Union[bool, str, None] = hf_token if hf_token is not None else False
 
     try:
-        split_name_items: List[SplitNameItem] = [
-            {"dataset": dataset, "config": config, "split": str(split)}
-            for split in get_dataset_split_names(path=dataset, config_name=config, use_auth_token=use_auth_token)
-        ]
+        split_names = get_dataset_split_names(path=dataset, config_name=config, use_auth_token=use_auth_token)
     except _EmptyDatasetError as err:
         raise EmptyDatasetError("The dataset is empty.", cause=err) from err
     except Exception as err:
@@ -109,6 +106,9 @@ def compute_split_names_from_streaming_response(
             f"Cannot get the split names for the config '{config}' of the dataset.",
             cause=err,
         ) from err
+    split_name_items: List[SplitNameItem] = [
+        {"dataset": dataset, "config": config, "split": str(split)} for split in split_names
+    ]
     return {"split_names": split_name_items}
 
 
@@ -130,6 +130,5 @@ class SplitNamesFromStreamingJobRunner(DatasetsBasedJobRunner):
 
     def get_new_splits(self, content: Mapping[str, Any]) -> set[SplitFullName]:
         """Get the set of new splits, from the content created by the compute."""
-        return {
-            SplitFullName(dataset=s["dataset"], config=s["config"], split=s["split"]) for s in content["split_names"]
-        }
+        make_split_full_name = SplitFullName._make
+        return {make_split_full_name((s["dataset"], s["config"], s["split"])) for s in content["split_names"]}